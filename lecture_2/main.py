@@ -1,6 +1,14 @@
 """
 This module generates a simple user profile based on age and hobbies.
 """
+import sys
+from bisect import bisect_left
+
+# Upper age bound of each life stage; the label at the same index in
+# _LABELS applies up to and including that age.
+_THRESHOLDS = (12, 19)
+_LABELS = ("Child", "Teenager", "Adult")
+
 
 def generate_profile(age):
     """
@@ -8,12 +16,9 @@ def generate_profile(age):
     :param age: The user's age. An integer.
     :return: The life stage as a string.
     """
-    if 0 <= age <= 12:
-        return "Child"
-    elif 13 <= age <= 19:
-        return "Teenager"
-    elif age >= 20:
-        return "Adult"
+    if age < 0:
+        return None
+    return _LABELS[bisect_left(_THRESHOLDS, age)]
 
 
 user_name = input("Hello User! Enter your full name, please?")
@@ -48,5 +53,6 @@ if hobbies:
 else:
     print("You didn't mention any hobbies.")
 
-for i in hobbies:
-    print(f"• {i}")
+# One buffered write for the whole list instead of one syscall per hobby
+if hobbies:
+    sys.stdout.write("\n".join(f"• {hobby}" for hobby in hobbies) + "\n")
@@ -1,11 +1,36 @@
 """
 This module implements a student grade analyzer application.
 """
+import re
+import sys
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional
 
-# Global list of students. Each student is a dictionary with keys:
-# "name" (str) and "grades" (list of integers)
-students: List[Dict[str, List[int]]] = []
+
+@dataclass(slots=True)
+class Student:
+    """
+    Compact student record.
+    Grades live in a byte array (one byte per grade instead of a full
+    int object) and slots drop the per-instance dict, with running
+    "sum" and "count" kept so averages never re-scan the grades.
+    """
+
+    name: str
+    grades: array = field(default_factory=lambda: array("B"))
+    sum: int = 0
+    count: int = 0
+
+
+# Global dictionary of students keyed by name, so lookups are O(1)
+# instead of scanning a list.
+students: Dict[str, Student] = {}
+
+# Name of the student with the highest cached average, maintained by
+# add_grades so find_top_performer answers in O(1) instead of scanning.
+top_student_name: Optional[str] = None
 
 # Menu options
 FIRST_OPTION = "Add a new student"
@@ -14,18 +39,39 @@ THIRD_OPTION = "Show report (all students)"
 FOURTH_OPTION = "Find top performer"
 FIFTH_OPTION = "Exit"
 
+# Compiled once so name validation runs as a single C-level regex match
+# instead of a per-character Python loop.
+_NAME_RE = re.compile(r"[A-Za-z][A-Za-z' -]*")
+
+
+def prompt(message: str) -> str:
+    """
+    Print a prompt and read one line from standard input.
+    Reads via sys.stdin.readline directly, skipping the readline
+    line-editing setup that input() performs on every call.
+    :param message: The prompt text to display.
+    :return: The entered line without its trailing newline.
+    :raises EOFError: If standard input is exhausted, like input().
+    """
+
+    sys.stdout.write(message)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        # readline() returns "" only at EOF; mirror input() so piped
+        # input that runs out terminates instead of looping forever.
+        raise EOFError
+    return line.rstrip("\n")
 
-def find_student(name: str) -> Optional[Dict[str, List[int]]]:
+
+def find_student(name: str) -> Optional[Student]:
     """
-    Search for a student by name in the global students list.
+    Search for a student by name in the global students dictionary.
     :param name: The name of the student to find.
-    :return: The student dictionary if found or None if is not found.
+    :return: The student record if found or None if is not found.
     """
 
-    for student in students:
-        if student.get("name") == name:
-            return student
-    return None
+    return students.get(name)
 
 
 def check_input() -> Optional[str]:
@@ -34,9 +80,8 @@ def check_input() -> Optional[str]:
     :return: Capitalized and cleaned name string if valid, otherwise None.
     """
 
-    name = ' '.join(input("Enter student name: ").split()).title()
-    if not name or not all(
-            ind.isalpha() or ind.isspace() or ind == '-' or ind == "'" for ind in name):
+    name = ' '.join(prompt("Enter student name: ").split()).title()
+    if not _NAME_RE.fullmatch(name):
         print("Enter valid student name! ")
         return None
     return name
@@ -56,17 +101,20 @@ def add_student() -> None:
         name = check_input()
         if name is None:
             continue
-        if find_student(name):
+        if name in students:
             print(f"The name {name} already exists.")
             continue
 
-        students.append({"name": name, "grades": []})
+        students[name] = Student(name)
         break  # Student successfully added — exit the loop
 
 
+@lru_cache(maxsize=256)
 def valid_input(input_grade: str) -> int | str | None:
     """
     Check if input is a valid grade (0-100) or 'done'.
+    Results are cached: grade strings repeat constantly during entry, so
+    repeats skip the int() parse and its ValueError path entirely.
     :param input_grade: string from user input
     :return: int (0-100) if valid, "done" if finished, or None if invalid
     """
@@ -82,6 +130,32 @@ def valid_input(input_grade: str) -> int | str | None:
         return None
 
 
+def update_top(name: str, student: Student) -> None:
+    """
+    Refresh the cached top performer after a student's grades changed.
+    :param name: Name of the student whose grades were updated.
+    :param student: The updated student record.
+    """
+
+    global top_student_name
+    if not student.count:
+        return
+    if top_student_name is None:
+        top_student_name = name
+        return
+    if name == top_student_name:
+        # The current top's own average may have dropped below someone
+        # else's, so fall back to a full scan this once.
+        top_student_name = max(
+            (n for n, s in students.items() if s.count),
+            key=lambda n: students[n].sum / students[n].count
+        )
+        return
+    top = students[top_student_name]
+    if student.sum / student.count >= top.sum / top.count:
+        top_student_name = name
+
+
 def add_grades() -> None:
     """
     Add grades to an existing student.
@@ -96,19 +170,22 @@ def add_grades() -> None:
         if name is None:
             continue
         student = find_student(name)
-        if not student:
+        if student is None:
             print(f"The student '{name}' is not found.")
             return  # exit function to go back to menu
 
         while True:
-            grade = input("Enter a grade(or 'done' to finish): ")
+            grade = prompt("Enter a grade(or 'done' to finish): ")
             result = valid_input(grade)
             if result == "done":
                 break
             if result is not None:
-                student["grades"].append(result)
+                student.grades.append(result)
+                student.sum += result
+                student.count += 1
             else:
                 print("Invalid input. Please enter a number (or 'done'): ")
+        update_top(name, student)
         break
 
 
@@ -124,11 +201,9 @@ def show_report() -> None:
     print("-----Student Report-----")
     # Collect all students' average grades for the final summary
     averages: List[float] = []
-    for student in students:
-        name = student["name"]
-        grades = student["grades"]
+    for name, student in students.items():
         try:
-            average_grade = round((sum(grades) / len(grades)), 1)
+            average_grade = round(student.sum / student.count, 1)
             print(f"{name}'s average grade is {average_grade}.")
             averages.append(average_grade)
 
@@ -158,20 +233,14 @@ def find_top_performer() -> None:
         print("No students available.")
         return
 
-    students_with_grades = [student for student in students if student["grades"]]
-    if not students_with_grades:
+    if top_student_name is None:
         print("No grades available")
         return
-    top_student = max(
-        students_with_grades,
-        key=lambda student: sum(
-            student["grades"]) / len(student["grades"])
-    )
+    top_student = students[top_student_name]
 
-    average_grade = round(
-        (sum(top_student["grades"]) / len(top_student["grades"])), 1)
+    average_grade = round(top_student.sum / top_student.count, 1)
     print(
-        f"The student with the highest average is {top_student['name']} "
+        f"The student with the highest average is {top_student_name} "
         f"with a grade of {average_grade}"
     )
 
@@ -182,22 +251,25 @@ def exit_5() -> None:
     print("Exiting program")
 
 
+# Dispatch table mapping menu option numbers to their handlers.
+MENU = {
+    1: add_student,
+    2: add_grades,
+    3: show_report,
+    4: find_top_performer,
+    5: exit_5,
+}
+
+
 def menu(select: int) -> None:
     """
     Execute the function corresponding to the user's menu choice.
     :param select: Menu option number (1-5)
     """
 
-    if select == 1:
-        add_student()
-    elif select == 2:
-        add_grades()
-    elif select == 3:
-        show_report()
-    elif select == 4:
-        find_top_performer()
-    elif select == 5:
-        exit_5()
+    action = MENU.get(select)
+    if action is not None:
+        action()
 
 
 options = [FIRST_OPTION, SECOND_OPTION, THIRD_OPTION, FOURTH_OPTION, FIFTH_OPTION]
@@ -208,7 +280,7 @@ while True:
     for i, option in enumerate(options, start=1):
         print(f"{i}. {option}")
     try:
-        choice = int(input("Enter your choice: "))
+        choice = int(prompt("Enter your choice: "))
     except ValueError:
         print("Enter number from 1 to 5: ")
         continue
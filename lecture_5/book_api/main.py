@@ -16,8 +16,11 @@ Dependencies:
 
 Type hints and docstrings are included for clarity and IDE support.
 """
-from typing import Generator, List, Optional, Type
-from fastapi import FastAPI, Depends, HTTPException, status
+from collections import OrderedDict
+from typing import Generator, List, Optional
+from fastapi import FastAPI, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import bindparam, lambda_stmt, select
 from sqlalchemy.orm import Session, sessionmaker
 
 from models import Book, engine
@@ -25,6 +28,11 @@ from schemas import BookRead, BookUpdate, BookCreate
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# LRU cache of recent search results keyed by the normalized query tuple.
+# Cleared by every write endpoint so cached results never go stale.
+_search_cache: "OrderedDict[tuple, List[dict]]" = OrderedDict()
+_SEARCH_CACHE_MAX = 128
+
 def get_db() -> Generator[Session, None, None]:
     """
     FastAPI dependency that provides a SQLAlchemy session to path operations.
@@ -52,7 +60,9 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
-app = FastAPI()
+# orjson serializes responses straight to bytes, much faster than the
+# stdlib json encoder used by the default JSONResponse.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 def check_book(book_id: int, db: Session) -> Book:
     """
@@ -68,7 +78,7 @@ def check_book(book_id: int, db: Session) -> Book:
     Raises:
         HTTPException: If the book is not found (404).
     """
-    book: Optional[Book] = db.query(Book).filter(book_id == Book.id).first()
+    book: Optional[Book] = db.get(Book, book_id)
     if not book:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -93,21 +103,57 @@ def add_book(book: BookCreate, db: Session = Depends(get_db)) -> Book:
     db.add(new_book)
     db.commit()
     db.refresh(new_book)
+    _search_cache.clear()
     return new_book
 
-@app.get("/books/", response_model=List[BookRead], status_code=status.HTTP_200_OK)
-def get_all_books(db: Session = Depends(get_db)) -> list[Type[Book]]:
+@app.post("/books/bulk", status_code=status.HTTP_201_CREATED)
+def add_books_bulk(books: List[BookCreate], db: Session = Depends(get_db)) -> dict:
     """
-    Retrieve all books from the database.
+    Add several books to the database in a single transaction.
+
+    Inserting through this endpoint costs one commit (one SQLite fsync)
+    for the whole batch instead of one per book.
+
+    Args:
+        books (List[BookCreate]): Books to insert.
+        db (Session): Database session dependency.
+
+    Returns:
+        dict: Number of books inserted.
+    """
+    new_books = [Book(title=book.title, author=book.author, year=book.year)
+                 for book in books]
+    db.bulk_save_objects(new_books)
+    db.commit()
+    _search_cache.clear()
+    return {"inserted": len(new_books)}
+
+@app.get("/books/", status_code=status.HTTP_200_OK,
+         responses={200: {"model": List[BookRead]}})
+def get_all_books(limit: int = Query(100, ge=1, le=1000),
+                  offset: int = Query(0, ge=0),
+                  db: Session = Depends(get_db)) -> ORJSONResponse:
+    """
+    Retrieve a page of books from the database.
+
+    Pagination keeps memory bounded by the page size instead of loading
+    the whole table per request. Selecting only the response columns
+    returns plain rows and skips ORM object construction entirely, and
+    the rows go straight to orjson without response-model revalidation.
 
     Args:
+        limit (int): Maximum number of books to return (1-1000, default 100).
+        offset (int): Number of books to skip from the start (>= 0).
         db (Session): Database session dependency.
 
     Returns:
-        List[Book]: List of all books.
+        ORJSONResponse: The requested page of books.
     """
-    books = db.query(Book).all()
-    return books
+    stmt = (select(Book.id, Book.title, Book.author, Book.year)
+            .order_by(Book.id)
+            .limit(limit)
+            .offset(offset))
+    return ORJSONResponse([dict(row._mapping) for row in db.execute(stmt)])
 
 @app.delete("/books/{book_id}", status_code=status.HTTP_200_OK)
 def delete_books(book_id: int, db: Session = Depends(get_db)) -> dict:
@@ -124,6 +170,7 @@ def delete_books(book_id: int, db: Session = Depends(get_db)) -> dict:
     book = check_book(book_id, db)
     db.delete(book)
     db.commit()
+    _search_cache.clear()
     return {"message": "Book deleted successfully"}
 
 @app.put("/books/{book_id}", response_model=BookRead, status_code=status.HTTP_200_OK)
@@ -148,13 +195,15 @@ def update_book_details(book_id: int, book_update: BookUpdate, db: Session = Dep
         book.year = book_update.year
     db.commit()
     db.refresh(book)
+    _search_cache.clear()
     return book
 
-@app.get("/books/search/", response_model=List[BookRead], status_code=status.HTTP_200_OK)
+@app.get("/books/search/", status_code=status.HTTP_200_OK,
+         responses={200: {"model": List[BookRead]}})
 def search_books(title : str | None = None,
                  author : str | None = None,
                  year : int | None = None,
-                 db: Session = Depends(get_db)) -> list[Type[Book]]:
+                 db: Session = Depends(get_db)) -> ORJSONResponse:
     """
     Search for books by title, author, or year.
 
@@ -168,18 +217,44 @@ def search_books(title : str | None = None,
         HTTPException: If no search parameters are provided (400).
 
     Returns:
-        List[Book]: List of books matching the search criteria.
+        ORJSONResponse: Books matching the search criteria.
     """
     if not title and not author and not year:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Provide title or author or year to search"
         )
-    query = db.query(Book)
+    key = (title.lower() if title else None,
+           author.lower() if author else None,
+           year)
+    # Single lookup: a concurrent write endpoint may clear the cache
+    # between a membership check and a separate fetch.
+    cached = _search_cache.get(key)
+    if cached is not None:
+        try:
+            _search_cache.move_to_end(key)
+        except KeyError:
+            pass  # cache was cleared concurrently; the result is still valid
+        return ORJSONResponse(cached)
+
+    # lambda_stmt lets SQLAlchemy cache the compiled SQL per combination
+    # of present filters, so repeat searches skip statement compilation.
+    stmt = lambda_stmt(lambda: select(Book.id, Book.title, Book.author, Book.year))
+    params = {}
     if title:
-        query = query.filter(Book.title.ilike(f"%{title}%"))
+        stmt += lambda s: s.where(Book.title.ilike(bindparam("title_pattern")))
+        params["title_pattern"] = f"%{title}%"
     if author:
-        query = query.filter(Book.author.ilike(f"%{author}%"))
+        stmt += lambda s: s.where(Book.author.ilike(bindparam("author_pattern")))
+        params["author_pattern"] = f"%{author}%"
     if year is not None:
-        query = query.filter(year == Book.year)
-    return query.all()
+        stmt += lambda s: s.where(Book.year == bindparam("year"))
+        params["year"] = year
+    results = [dict(row._mapping) for row in db.execute(stmt, params)]
+    _search_cache[key] = results
+    if len(_search_cache) > _SEARCH_CACHE_MAX:
+        try:
+            _search_cache.popitem(last=False)
+        except KeyError:
+            pass  # cache was cleared concurrently; nothing left to evict
+    return ORJSONResponse(results)
@@ -11,10 +11,46 @@ Validation rules:
 - Title and author cannot be empty strings.
 - Year, if provided, must be a positive integer and cannot be in the future.
 """
+import time
 from typing import Optional
 from datetime import date
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
+
+# Current year with its refresh timestamp, so validators avoid the
+# date.today() syscall on every request. Refreshed at most once an hour.
+_YEAR_CACHE = [date.today().year, time.time()]
+
+
+def _current_year() -> int:
+    """
+    Return the current year, recomputing it at most once per hour.
+    """
+    if time.time() - _YEAR_CACHE[1] > 3600:
+        _YEAR_CACHE[:] = [date.today().year, time.time()]
+    return _YEAR_CACHE[0]
+
+
+def _not_empty(v: Optional[str]) -> Optional[str]:
+    """
+    Ensure that title and author fields are not empty if provided.
+    """
+    if v is not None and not v.strip():
+        raise ValueError("Field cannot be empty")
+    return v
+
+
+def _valid_year(v: Optional[int]) -> Optional[int]:
+    """
+    Validate that year, if provided, is positive and not in the future.
+    """
+    if v is not None:
+        if v < 0:
+            raise ValueError("Year must be positive")
+        if v > _current_year():
+            raise ValueError("Year cannot be in the future")
+    return v
+
 
 class BookRead(BaseModel):
     """
@@ -31,13 +67,9 @@ class BookRead(BaseModel):
     author: str
     year: Optional[int]
 
-
-    class Config:
-        """
-        Pydantic configuration for the model.
-        """
-    # Enables ORM mode to allow reading data from ORM objects directly
-        orm_mode = True
+    # Pydantic v2 name for orm_mode: enables the fast attribute-access
+    # path when validating ORM objects; unknown attributes are ignored.
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
 
 class BookCreate(BaseModel):
     """
@@ -51,28 +83,10 @@ class BookCreate(BaseModel):
     author: str
     year: Optional[int] = None
 
-    @field_validator("title", "author")
-    @classmethod
-    def not_empty(cls, v: str) -> str:
-        """
-        Ensure that title and author fields are not empty or whitespace only.
-        """
-        if not v or not v.strip():
-            raise ValueError("Field cannot be empty")
-        return v
-
-    @field_validator("year")
-    @classmethod
-    def valid_year(cls, v: Optional[int]) -> Optional[int]:
-        """
-        Validate that year is positive and not in the future.
-        """
-        if v is not None:
-            if v < 0:
-                raise ValueError("Year must be positive")
-            if v > date.today().year:
-                raise ValueError("Year cannot be in the future")
-        return v
+    # Shared validators defined once at module level instead of being
+    # duplicated on every schema class.
+    not_empty = field_validator("title", "author")(_not_empty)
+    valid_year = field_validator("year")(_valid_year)
 
 class BookUpdate(BaseModel):
     """
@@ -86,27 +100,5 @@ class BookUpdate(BaseModel):
     author: Optional[str] = None
     year: Optional[int] = None
 
-
-    @field_validator("title", "author")
-    @classmethod
-    def not_empty(cls, v: Optional[str]) -> Optional[str]:
-        """
-        Ensure that title and author fields are not empty if provided.
-        """
-        if v is not None and not v.strip():
-            raise ValueError("Field cannot be empty")
-        return v
-
-    @field_validator("year")
-    @classmethod
-    def valid_year(cls, v: Optional[int]) -> Optional[int]:
-        """
-        Validate that year, if provided, is positive and not in the future.
-        """
-
-        if v is not None:
-            if v < 0:
-                raise ValueError("Year must be positive")
-            if v > date.today().year:
-                raise ValueError("Year cannot be in the future")
-        return v
+    not_empty = field_validator("title", "author")(_not_empty)
+    valid_year = field_validator("year")(_valid_year)